@@ -1,10 +1,21 @@
 import sys
 import os
+import io
 import json
 import math
+import time
+from collections import deque
+from contextlib import contextmanager
 from datetime import datetime
+from functools import lru_cache
 from typing import List, Optional, Union, Tuple, Dict
 
+# orjson is optional, it just makes saving/loading big histories faster
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 # This is to use native pixel resolution
 os.environ["QT_AUTO_SCREEN_SCALE_FACTOR"] = "0"
 os.environ["QT_SCALE_FACTOR"] = "1"
@@ -16,9 +27,9 @@ from PyQt5.QtWidgets import (
     QMenu, QMessageBox, QFileDialog, QInputDialog, QAbstractItemView,
     QStyle, QStyledItemDelegate, QLineEdit, QFrame, QTreeWidgetItemIterator
 )
-from PyQt5.QtCore import Qt, QTimer, QPoint, QRect, QSize, QEvent, pyqtSignal
+from PyQt5.QtCore import Qt, QTimer, QPoint, QPointF, QRect, QSize, QEvent, QRunnable, QThreadPool, QSignalBlocker, pyqtSignal
 from PyQt5.QtGui import (
-    QPainter, QPen, QColor, QFont, QCursor, QBrush, QIcon, QPalette
+    QPainter, QPen, QColor, QFont, QFontMetrics, QCursor, QBrush, QIcon, QPalette, QPixmap, QPixmapCache, QPainterPath
 )
 
 
@@ -27,6 +38,12 @@ from PyQt5.QtGui import (
 
 # 
 class CoordinateItem:
+    # slots keep each captured item small, users can collect thousands of them
+    # col0/col1 are the tree's display strings, built once instead of on every refresh
+    __slots__ = ("x", "y", "name", "timestamp", "col0", "col1")
+    # shown in front of the name in the tree
+    PREFIX = "📍 "
+
     def __init__(self, x: int, y: int, name: str = "", timestamp: Optional[str] = None):
         self.x = x
         self.y = y
@@ -34,20 +51,37 @@ class CoordinateItem:
         self.name = name or f"Point ({x}, {y})"
         # Timestamp to view them by time stamp and later to implement control z and control y controls
         self.timestamp = timestamp or datetime.now().isoformat()
+        self.col0 = self.PREFIX + self.name
+        self.col1 = f"({x}, {y})"
+
+    def rename(self, name):
+        self.name = name
+        self.col0 = self.PREFIX + name
 
     def to_dict(self):
         return {"type": "coordinate", "x": self.x, "y": self.y, "name": self.name, "timestamp": self.timestamp}
 
 class MeasurementItem:
+    __slots__ = ("x1", "y1", "x2", "y2", "distance", "int_distance", "name", "timestamp", "auto_aligned", "col0", "col1")
+    PREFIX = "📏 "
+
     def __init__(self, x1, y1, x2, y2, distance, name="", timestamp=None, auto_aligned=False):
         self.x1, self.y1 = x1, y1
         self.x2, self.y2 = x2, y2
         self.distance = distance # useful for applications like moviepy or similar.
+        # whole pixels, as shown everywhere in the UI. distance never changes so cast it once
+        self.int_distance = int(distance)
         # name to make it easier to organize.
-        self.name = name or f"Measurement {int(distance)}px"
+        self.name = name or f"Measurement {self.int_distance}px"
         # later to add ability to undo/redo.
         self.timestamp = timestamp or datetime.now().isoformat()
         self.auto_aligned = auto_aligned
+        self.col0 = self.PREFIX + self.name
+        self.col1 = f"{self.int_distance}px ({x1},{y1})→({x2},{y2})" + (" [Aligned]" if auto_aligned else "")
+
+    def rename(self, name):
+        self.name = name
+        self.col0 = self.PREFIX + name
 
     def to_dict(self):
         return {
@@ -56,11 +90,20 @@ class MeasurementItem:
         }
 
 class FolderItem:
+    __slots__ = ("name", "timestamp", "items", "expanded", "col0", "col1")
+    PREFIX = "📁 "
+
     def __init__(self, name="", timestamp=None, items=None, expanded=True):
         self.name = name or "New Folder"
         self.timestamp = timestamp or datetime.now().isoformat()
         self.items = items if items is not None else []
         self.expanded = expanded
+        self.col0 = self.PREFIX + self.name
+        self.col1 = f"{len(self.items)} items"
+
+    def rename(self, name):
+        self.name = name
+        self.col0 = self.PREFIX + name
 
     def to_dict(self):
         return {
@@ -70,109 +113,171 @@ class FolderItem:
 
 
 
+class _SaveTask(QRunnable):
+    """Encodes a snapshot of the data and writes it to disk, runs on the DataStore's save pool."""
+
+    def __init__(self, data, path):
+        super().__init__()
+        self.data = data
+        self.path = path
+
+    def run(self):
+        try:
+            if orjson:
+                payload = orjson.dumps(self.data, option=orjson.OPT_INDENT_2)
+            else:
+                payload = json.dumps(self.data, indent=2).encode("utf-8")
+            # Write next to the real file and swap it in, so a crash never leaves half a file
+            tmp_path = self.path + ".tmp"
+            with io.BufferedWriter(io.FileIO(tmp_path, "wb"), buffer_size=65536) as f:
+                f.write(payload)
+            os.replace(tmp_path, self.path)
+        except Exception as e:
+            print(f"Error saving: {e}")
+
+
 # for storing all data  
 class DataStore:
     # not sure if this is necessary anymore.
     DATA_FILE = os.path.expanduser("~/.screen_coordinate_tool_qt.json")
+    # Changes within this window are written to disk together
+    SAVE_DELAY_MS = 300
 
     def __init__(self):
         self.root_items = []
+        self._pending_tree = None
+        # Restarted by every change, so a burst of changes is written once it settles down
+        self._save_timer = QTimer()
+        self._save_timer.setSingleShot(True)
+        self._save_timer.setInterval(self.SAVE_DELAY_MS)
+        self._save_timer.timeout.connect(self.flush)
+        # Encoding and writing happen off the UI thread. One thread only, so saves land in order
+        # and never share the temp file
+        self._save_pool = QThreadPool()
+        self._save_pool.setMaxThreadCount(1)
         self.load()
 
     def save_from_tree(self, tree_widget: QTreeWidget):
-        """Rebuilds data model from the UI Tree structure and saves it."""
+        """Schedules a save of the UI Tree structure, a burst of changes is saved once."""
+        self._pending_tree = tree_widget
+        self._save_timer.start()
+
+    def flush(self):
+        """Rebuilds data model from the UI Tree structure and saves it right away."""
+        if self._pending_tree is None:
+            return
+        self._save_timer.stop()
+        tree_widget, self._pending_tree = self._pending_tree, None
         self.root_items = self._serialize_tree(tree_widget.invisibleRootItem())
         self._save_to_disk()
 
     def _serialize_tree(self, parent_item: QTreeWidgetItem) -> List:
+        # Walks the tree with a stack instead of recursion, each folder's list is filled when popped
         items = []
-        for i in range(parent_item.childCount()):
-            child = parent_item.child(i)
-            data = child.data(0, Qt.UserRole)
-            
-            # The text in column 0 might have the emoji prefix, we want the raw name.
-            raw_text = child.text(0)
-            clean_name = raw_text
-            for prefix in ["📍 ", "📏 ", "📁 "]:
-                if clean_name.startswith(prefix):
-                    clean_name = clean_name[len(prefix):]
-            
-            if isinstance(data, FolderItem):
-                data.expanded = child.isExpanded()
-                data.name = clean_name
-                data.items = self._serialize_tree(child)
-                items.append(data)
-            else:
-                data.name = clean_name
-                items.append(data)
+        stack = [(parent_item, items)]
+        while stack:
+            parent_item, out = stack.pop()
+            for i in range(parent_item.childCount()):
+                child = parent_item.child(i)
+                # Names are kept up to date on the model itself, only the structure comes from the tree
+                data = child.model
+                if isinstance(data, FolderItem):
+                    data.expanded = child.isExpanded()
+                    data.items = []
+                    stack.append((child, data.items))
+                out.append(data)
         return items
 
+    def close(self):
+        """Writes out a pending save and waits until it is on disk, for when the app quits."""
+        self.flush()
+        self._save_pool.waitForDone()
+
     def _save_to_disk(self):
-        try:
-            data = [item.to_dict() for item in self.root_items]
-            with open(self.DATA_FILE, "w") as f:
-                json.dump(data, f, indent=2)
-        except Exception as e:
-            print(f"Error saving: {e}")
+        # The snapshot is taken here on the UI thread, the worker only sees plain dicts
+        data = [item.to_dict() for item in self.root_items]
+        self._save_pool.start(_SaveTask(data, self.DATA_FILE))
 
     def load(self):
         if not os.path.exists(self.DATA_FILE):
             return
         try:
-            with open(self.DATA_FILE, "r") as f:
-                raw_data = json.load(f)
-                self.root_items = self._parse_items(raw_data)
+            with open(self.DATA_FILE, "rb") as f:
+                raw = f.read()
+            raw_data = orjson.loads(raw) if orjson else json.loads(raw)
+            self.root_items = self._parse_items(raw_data)
         except Exception as e:
             print(f"Error loading: {e}")
 
     def _parse_items(self, json_list):
         items = []
-        for d in json_list:
-            if d['type'] == 'coordinate':
-                items.append(CoordinateItem(d['x'], d['y'], d.get('name'), d.get('timestamp')))
-            elif d['type'] == 'measurement':
-                items.append(MeasurementItem(d['x1'], d['y1'], d['x2'], d['y2'], d['distance'], d.get('name'), d.get('timestamp'), d.get('auto_aligned')))
-            elif d['type'] == 'folder':
-                folder = FolderItem(d['name'], d.get('timestamp'), expanded=d.get('expanded', True))
-                folder.items = self._parse_items(d.get('items', []))
-                items.append(folder)
+        stack = [(json_list, items)]
+        while stack:
+            json_list, out = stack.pop()
+            for d in json_list:
+                if d['type'] == 'coordinate':
+                    out.append(CoordinateItem(d['x'], d['y'], d.get('name'), d.get('timestamp')))
+                elif d['type'] == 'measurement':
+                    out.append(MeasurementItem(d['x1'], d['y1'], d['x2'], d['y2'], d['distance'], d.get('name'), d.get('timestamp'), d.get('auto_aligned')))
+                elif d['type'] == 'folder':
+                    folder = FolderItem(d['name'], d.get('timestamp'), expanded=d.get('expanded', True))
+                    children = d.get('items', [])
+                    # The children are filled in later, so set the count text from the json now
+                    folder.col1 = f"{len(children)} items"
+                    stack.append((children, folder.items))
+                    out.append(folder)
         return items
 
 
 # --- UI Components ---
 
+# Text shaping is the expensive part of painting labels, so metrics and widths are cached per font.
+_font_metrics: Dict[str, QFontMetrics] = {}
+
+def font_metrics(font: QFont) -> QFontMetrics:
+    key = font.key()
+    fm = _font_metrics.get(key)
+    if fm is None:
+        fm = _font_metrics[key] = QFontMetrics(font)
+    return fm
+
+@lru_cache(maxsize=1024)
+def _measure_text(font_key: str, text: str) -> int:
+    return _font_metrics[font_key].horizontalAdvance(text)
+
+def measure_text(font: QFont, text: str) -> int:
+    """Width of text in pixels, same as QFontMetrics.horizontalAdvance but memoized."""
+    font_metrics(font)
+    return _measure_text(font.key(), text)
+
+class ModelTreeItem(QTreeWidgetItem):
+    """Tree item that keeps its model object as a plain attribute instead of in a QVariant."""
+
+    def __init__(self, model):
+        super().__init__()
+        self.model = model
+
+
 class SmartRenameDelegate(QStyledItemDelegate):
     def createEditor(self, parent, option, index):
         return QLineEdit(parent)
 
     def setEditorData(self, editor, index):
-        # When entering edit mode, show the text WITHOUT the emoji prefix
-        text = index.model().data(index, Qt.EditRole)
-        for prefix in ["📍 ", "📏 ", "📁 "]:
-            if text.startswith(prefix):
-                text = text[len(prefix):]
-                break
-        editor.setText(text)
+        # When entering edit mode, show the plain name WITHOUT the emoji prefix
+        editor.setText(self.parent().model_at(index).name)
 
     def setModelData(self, editor, model, index):
         # When saving, re-apply the correct emoji prefix based on item type
         new_text = editor.text()
-        data = index.data(Qt.UserRole)
+        data = self.parent().model_at(index)
         
-        prefix = ""
-        if isinstance(data, CoordinateItem):
-            prefix = "📍 "
-        elif isinstance(data, MeasurementItem):
-            prefix = "📏 "
-        elif isinstance(data, FolderItem):
-            prefix = "📁 "
-            
-        if not new_text.startswith(prefix):
-            final_text = prefix + new_text
-        else:
-            final_text = new_text
-            
-        model.setData(index, final_text, Qt.EditRole)
+        prefix = data.PREFIX
+        if new_text.startswith(prefix):
+            new_text = new_text[len(prefix):]
+
+        # The model holds the plain name, so saving never has to parse the display text
+        data.rename(new_text)
+        model.setData(index, data.col0, Qt.EditRole)
 
 
 class HistoryTreeWidget(QTreeWidget):
@@ -189,25 +294,69 @@ class HistoryTreeWidget(QTreeWidget):
         # Visual styling improvements for hierarchy
         self.setAlternatingRowColors(True)
         self.setIndentation(25) # Deeper indentation to make folders clearer
+
+        # Every row is one line of text, so the view can skip measuring each row's height
+        self.setUniformRowHeights(True)
+        self.setAnimated(False)
+        # Double-click renames, it shouldn't also fold the folder being renamed
+        self.setExpandsOnDoubleClick(False)
         
         # Install Delegate
         self.setItemDelegateForColumn(0, SmartRenameDelegate(self))
 
     def dropEvent(self, event):
+        before = self._structure_signature()
+        # Only the folders the items leave and land in need a new count
+        moved = self.selectedItems()
+        old_parents = [item.parent() for item in moved]
         super().dropEvent(event)
+        # Dropping items back where they were changes nothing, skip the recount and save
+        if self._structure_signature() == before:
+            return
         self.sanitize_tree()
         if self.window():
-            self.window().recalculate_folder_counts()
+            self.window().update_folder_counts(old_parents + [item.parent() for item in moved])
             self.window().save_data()
 
+    def model_at(self, index):
+        """Model object of the item at a model index, for code that only gets the index."""
+        return self.itemFromIndex(index).model
+
+    def _structure_signature(self):
+        """Items in tree order paired with their parent, equal signatures mean the same tree."""
+        signature = []
+        iterator = QTreeWidgetItemIterator(self)
+        while iterator.value():
+            item = iterator.value()
+            parent = item.parent()
+            signature.append((id(item.model), id(parent.model) if parent else None))
+            iterator += 1
+        return signature
+
+    @contextmanager
+    def bulk_update(self):
+        """Holds back repaints, sorting and signals while many items are changed at once."""
+        sorting = self.isSortingEnabled()
+        self.setUpdatesEnabled(False)
+        self.blockSignals(True)
+        self.setSortingEnabled(False)
+        try:
+            yield
+        finally:
+            self.setSortingEnabled(sorting)
+            self.blockSignals(False)
+            self.setUpdatesEnabled(True)
+            self.viewport().update()
+
     def sanitize_tree(self):
         root = self.invisibleRootItem()
-        self._check_node(root)
+        with self.bulk_update():
+            self._check_node(root)
 
     def _check_node(self, parent):
         for i in range(parent.childCount() - 1, -1, -1):
             child = parent.child(i)
-            data = child.data(0, Qt.UserRole)
+            data = child.model
             
             if not isinstance(data, FolderItem) and child.childCount() > 0:
                 take_children = []
@@ -227,34 +376,58 @@ class OverlayWindow(QWidget):
         # --- Window Setup ---
         self.setWindowFlags(Qt.FramelessWindowHint | Qt.WindowStaysOnTopHint | Qt.Tool)
         self.setAttribute(Qt.WA_TranslucentBackground)
-        self.showFullScreen()
         self.setMouseTracking(True)
+
+        # Fonts used on every paint are built once, QFont() goes through Qt's font database
+        self.label_font = QFont("Monospace", 16, QFont.Bold)
+        self.hint_font = QFont("Sans", 10)
+        self.notification_font = QFont("Sans", 12)
+
+        # The help panel and hint never change, so they are rendered once and blitted
+        self._help_pixmap = None
+        self._help_hint_pixmap = None
+        
+        self.setCursor(Qt.CrossCursor)
         
-        # State
+        # Nothing animates by itself, this only expires old notifications
+        self.notification_timer = QTimer(self)
+        self.notification_timer.timeout.connect(self.expire_notifications)
+
+        self.reset_state()
+
+    def reset_state(self):
+        """Puts the overlay back to a fresh capture, the window itself is kept and reused."""
         self.cursor_pos = QPoint(0, 0)
         self.corner_pos = 3 # 0=TR, 1=BR, 2=BL, 3=TL
         self.capture_mode = "normal" # "normal", "ruler", "edit"
         self.ruler_start = None
+        # Snapped ruler end and length, worked out once per mouse move rather than per paint
+        self._ruler_end = None
+        self._ruler_dist = 0.0
         self.shift_pressed = False
         self.show_help = True
-        self.notifications = [] 
+        # (text, expiry) pairs, oldest first. They all live equally long so they expire in order.
+        self.notifications = deque()
+        self.notification_timer.stop()
         
         # Edit Mode State
         self.session_items = [] # List of tuples: (item_model, rect/point)
         self.selected_item_index = -1
-        
-        self.setCursor(Qt.CrossCursor)
-        
-        self.timer = QTimer(self)
-        self.timer.timeout.connect(self.update)
-        self.timer.start(16)
+
+        # Bounding rects of what was last drawn, so only the changed areas get repainted
+        self._label_rect = QRect()
+        self._ruler_rect = QRect()
+        self._markers_rect = QRect()
+        self._notification_rects = []
+        self._notification_rect = QRect()
 
     def paintEvent(self, event):
         painter = QPainter(self)
         painter.setRenderHint(QPainter.Antialiasing)
+        dirty = event.rect()
 
         # 1. Edit Mode Markers
-        if self.capture_mode == "edit":
+        if self.capture_mode == "edit" and (self._markers_rect.isNull() or dirty.intersects(self._markers_rect)):
             self.draw_edit_markers(painter)
 
         # 2. Draw Ruler if active
@@ -262,96 +435,130 @@ class OverlayWindow(QWidget):
             self.draw_ruler(painter)
 
         # 3. UI Elements
-        self.draw_coordinate_label(painter)
+        if dirty.intersects(self.coordinate_label_rect()):
+            self.draw_coordinate_label(painter)
         
         if self.show_help:
-            self.draw_help(painter)
-        else:
+            if dirty.intersects(self.help_pixmap_rect()):
+                self.draw_help(painter)
+        elif dirty.intersects(self.help_hint_rect()):
             self.draw_help_hint(painter)
 
-        self.draw_notifications(painter)
+        if dirty.intersects(self._notification_rect):
+            self.draw_notifications(painter)
 
         # Edit Mode Banner
         if self.capture_mode == "edit":
-             self.draw_text_with_bg(painter, "-- EDIT MODE --", self.rect().width()/2, 50, QColor(0, 255, 255), bg_alpha=200)
+            painter.setFont(self.notification_font)
+            banner_rect = self.text_bg_rect(painter.font(), "-- EDIT MODE --", self.rect().width()/2, 50)
+            if dirty.intersects(banner_rect):
+                self.draw_text_with_bg(painter, "-- EDIT MODE --", self.rect().width()/2, 50, QColor(0, 255, 255), bg_alpha=200)
 
     def draw_edit_markers(self, painter):
         # Bright Orange
         marker_color = QColor(255, 140, 0) 
+        point_radius = 10 # Big points
         
         # Text settings
-        fm = painter.fontMetrics()
+        font = painter.font()
         screen_w = self.rect().width()
+        bbox = QRect()
 
-        for i, (item, _) in enumerate(self.session_items):
-            is_selected = (i == self.selected_item_index)
-            
-            # Thick black outline
-            pen = QPen(Qt.black, 3) 
-            if is_selected:
-                pen.setColor(Qt.cyan) # Highlight selection
-                pen.setWidth(4)
-                
-            painter.setPen(pen)
-            painter.setBrush(QBrush(marker_color))
+        # Shapes are collected into one path per style ([normal, selected]) and drawn after
+        # the loop, so the pen and brush only change a few times however many items there are.
+        line_paths = [QPainterPath(), QPainterPath()]
+        point_paths = [QPainterPath(), QPainterPath()]
+        for path in point_paths:
+            path.setFillRule(Qt.WindingFill) # overlapping points must not cancel out
+        labels = []
 
-            label_text = ""
-            label_pos = QPoint(0,0)
-            point_radius = 10 # Big points
+        for i, (item, _) in enumerate(self.session_items):
+            style = 1 if i == self.selected_item_index else 0
 
             if isinstance(item, CoordinateItem):
-                # Draw Point
-                painter.drawEllipse(item.x - point_radius, item.y - point_radius, point_radius * 2, point_radius * 2)
+                point_paths[style].addEllipse(QPointF(item.x, item.y), point_radius, point_radius)
                 
                 label_text = f"{item.name} ({item.x}, {item.y})"
                 
                 # Smart Positioning
-                text_width = fm.width(label_text) + 15
+                text_width = measure_text(font, label_text) + 15
                 if item.x + point_radius + text_width > screen_w:
                     offset_x = - (text_width / 2) - point_radius
                 else:
                     offset_x = (text_width / 2) + point_radius
                 
-                label_pos = QPoint(int(item.x + offset_x), item.y)
-
+                labels.append((label_text, QPoint(int(item.x + offset_x), item.y)))
+                bbox = bbox.united(QRect(item.x - point_radius, item.y - point_radius, point_radius * 2, point_radius * 2).adjusted(-2, -2, 2, 2))
 
             elif isinstance(item, MeasurementItem):
-                # Draw thicker line for measurement
-                line_pen = QPen(marker_color, 4)
-                if is_selected: line_pen = QPen(Qt.cyan, 4)
-                
-                # Draw black outline for line
-                outline_pen = QPen(Qt.black, 6)
-                painter.setPen(outline_pen)
-                painter.drawLine(int(item.x1), int(item.y1), int(item.x2), int(item.y2))
-                
-                # Draw actual colored line
-                painter.setPen(line_pen)
-                painter.drawLine(int(item.x1), int(item.y1), int(item.x2), int(item.y2))
-                
-                # Draw end points
-                painter.setPen(pen)
-                painter.drawEllipse(int(item.x1) - point_radius, int(item.y1) - point_radius, point_radius * 2, point_radius * 2)
-                painter.drawEllipse(int(item.x2) - point_radius, int(item.y2) - point_radius, point_radius * 2, point_radius * 2)
+                p1 = QPointF(int(item.x1), int(item.y1))
+                p2 = QPointF(int(item.x2), int(item.y2))
+                line_paths[style].moveTo(p1)
+                line_paths[style].lineTo(p2)
+                point_paths[style].addEllipse(p1, point_radius, point_radius)
+                point_paths[style].addEllipse(p2, point_radius, point_radius)
 
                 mid_x = (item.x1 + item.x2) / 2
                 mid_y = (item.y1 + item.y2) / 2
-                label_text = f"{item.name} [{int(item.distance)}px]"
-                label_pos = QPoint(int(mid_x), int(mid_y) - 20)
-
-            # Draw Label
-            if label_text:
-                self.draw_text_with_bg(painter, label_text, label_pos.x(), label_pos.y(), QColor(255, 255, 255), bg_alpha=160)
-
-    def draw_ruler(self, painter):
+                labels.append((f"{item.name} [{item.int_distance}px]", QPoint(int(mid_x), int(mid_y) - 20)))
+                line_rect = QRect(p1.toPoint(), p2.toPoint()).normalized()
+                bbox = bbox.united(line_rect.adjusted(-point_radius - 2, -point_radius - 2, point_radius + 2, point_radius + 2))
+
+        # Measurement lines: thick black outline under all of them, then the colored lines
+        painter.setBrush(Qt.NoBrush)
+        outline_path = QPainterPath(line_paths[0])
+        outline_path.addPath(line_paths[1])
+        painter.setPen(QPen(Qt.black, 6))
+        painter.drawPath(outline_path)
+        painter.setPen(QPen(marker_color, 4))
+        painter.drawPath(line_paths[0])
+        painter.setPen(QPen(Qt.cyan, 4)) # Highlight selection
+        painter.drawPath(line_paths[1])
+
+        # Points with a thick black outline, cyan when selected
+        painter.setBrush(QBrush(marker_color))
+        painter.setPen(QPen(Qt.black, 3))
+        painter.drawPath(point_paths[0])
+        painter.setPen(QPen(Qt.cyan, 4))
+        painter.drawPath(point_paths[1])
+
+        # Labels go on top of every shape
+        for label_text, label_pos in labels:
+            bbox = bbox.united(self.draw_text_with_bg(painter, label_text, label_pos.x(), label_pos.y(), QColor(255, 255, 255), bg_alpha=160))
+
+        self._markers_rect = bbox
+
+    def snap_ruler_end(self, end):
+        """Snaps the ruler end onto the start's axis when the line is nearly straight."""
         start = self.ruler_start
-        end = self.cursor_pos
-        
         if not self.shift_pressed:
             dx = abs(end.x() - start.x())
             dy = abs(end.y() - start.y())
             if dx > dy * 10: end = QPoint(end.x(), start.y())
             elif dy > dx * 10: end = QPoint(start.x(), end.y())
+        return end
+
+    def update_ruler(self):
+        """Snaps the ruler to the cursor and repaints the area it moved over."""
+        start = self.ruler_start
+        end = self.snap_ruler_end(self.cursor_pos)
+        # Moving along a snapped axis often lands on the same end point, nothing to redraw then
+        if end == self._ruler_end:
+            return
+        self._ruler_end = end
+        self._ruler_dist = math.hypot(end.x() - start.x(), end.y() - start.y())
+
+        # Line, end points and the distance label
+        mid = (start + end) / 2
+        label = self.text_bg_rect(self.font(), f"{int(self._ruler_dist)}px", mid.x(), mid.y() - 20)
+        label.adjust(0, 0, 0, self.fontMetrics().descent()) # the text's descenders hang below the box
+        new_rect = QRect(start, end).normalized().adjusted(-8, -8, 8, 8).united(label)
+        self.update(self._ruler_rect.united(new_rect))
+        self._ruler_rect = new_rect
+
+    def draw_ruler(self, painter):
+        start = self.ruler_start
+        end = self._ruler_end
 
         # Draw Outline (Black)
         pen_outline = QPen(Qt.black)
@@ -376,28 +583,33 @@ class OverlayWindow(QWidget):
         painter.drawEllipse(end, 4, 4)
 
         # Draw Text
-        dist = math.sqrt((end.x() - start.x())**2 + (end.y() - start.y())**2)
         mid = (start + end) / 2
-        text = f"{int(dist)}px"
+        text = f"{int(self._ruler_dist)}px"
         
         # White text on semi-transparent black
         self.draw_text_with_bg(painter, text, mid.x(), mid.y() - 20, QColor(255, 255, 255), bg_alpha=160)
 
-    def draw_coordinate_label(self, painter):
+    def coordinate_label_rect(self):
         text = f"X: {self.cursor_pos.x():04d}  Y: {self.cursor_pos.y():04d}"
         screen_geo = self.rect()
         margin = 20
-        font = QFont("Monospace", 16, QFont.Bold)
-        painter.setFont(font)
-        fm = painter.fontMetrics()
-        w = fm.width(text) + 20
-        h = fm.height() + 10
+        font = self.label_font
+        w = measure_text(font, text) + 20
+        h = font_metrics(font).height() + 10
         
         x, y = 0, 0
         if self.corner_pos == 0: x, y = screen_geo.width() - w - margin, margin
         elif self.corner_pos == 1: x, y = screen_geo.width() - w - margin, screen_geo.height() - h - margin
         elif self.corner_pos == 2: x, y = margin, screen_geo.height() - h - margin
         elif self.corner_pos == 3: x, y = margin, margin
+        # pad for the 2px border
+        return QRect(x, y, w, h).adjusted(-2, -2, 2, 2)
+
+    def draw_coordinate_label(self, painter):
+        text = f"X: {self.cursor_pos.x():04d}  Y: {self.cursor_pos.y():04d}"
+        painter.setFont(self.label_font)
+        self._label_rect = self.coordinate_label_rect()
+        x, y, w, h = self._label_rect.adjusted(2, 2, -2, -2).getRect()
 
         painter.setBrush(QBrush(QColor(0, 0, 0, 180)))
         painter.setPen(QPen(QColor(0, 255, 0), 2))
@@ -405,11 +617,28 @@ class OverlayWindow(QWidget):
         painter.setPen(QColor(0, 255, 0))
         painter.drawText(x + 10, y + h - 10, text)
 
-    def draw_help(self, painter):
+    def help_rect(self):
         screen_geo = self.rect()
         # WIDENED to 900px
         w, h = 900, 480 
-        x, y = (screen_geo.width() - w) // 2, (screen_geo.height() - h) // 3
+        return QRect((screen_geo.width() - w) // 2, (screen_geo.height() - h) // 3, w, h)
+
+    def help_pixmap_rect(self):
+        # The pixmap has a 1px margin for the border, so it covers a bit more than help_rect
+        return self.help_rect().adjusted(-1, -1, 1, 1)
+
+    def draw_help(self, painter):
+        if self._help_pixmap is None:
+            self._help_pixmap = self._build_help_pixmap()
+        painter.drawPixmap(self.help_pixmap_rect().topLeft(), self._help_pixmap)
+
+    def _build_help_pixmap(self):
+        w, h = self.help_rect().width(), self.help_rect().height()
+        x, y = 1, 1
+        pixmap = QPixmap(w + 2, h + 2)
+        pixmap.fill(Qt.transparent)
+        painter = QPainter(pixmap)
+        painter.setRenderHint(QPainter.Antialiasing)
 
         painter.setBrush(QBrush(QColor(0, 0, 0, 230)))
         painter.setPen(QPen(QColor(100, 100, 100), 1))
@@ -465,53 +694,114 @@ class OverlayWindow(QWidget):
         painter.setFont(font)
         painter.setPen(QColor(150, 150, 150))
         painter.drawText(QRect(x, y + h - 30, w, 30), Qt.AlignCenter, "Press H to hide this menu")
+        painter.end()
+        return pixmap
 
-    def draw_help_hint(self, painter):
+    def help_hint_rect(self):
         text = "Press H for Help"
         screen_geo = self.rect()
-        painter.setFont(QFont("Sans", 10))
-        fm = painter.fontMetrics()
-        w, h = fm.width(text) + 20, fm.height() + 10
-        x, y = (screen_geo.width() - w) // 2, screen_geo.height() - 50
+        font = self.hint_font
+        w, h = measure_text(font, text) + 20, font_metrics(font).height() + 10
+        return QRect((screen_geo.width() - w) // 2, screen_geo.height() - 50, w, h)
+
+    def draw_help_hint(self, painter):
+        if self._help_hint_pixmap is None:
+            self._help_hint_pixmap = self._build_help_hint_pixmap()
+        painter.drawPixmap(self.help_hint_rect().topLeft(), self._help_hint_pixmap)
+
+    def _build_help_hint_pixmap(self):
+        text = "Press H for Help"
+        w, h = self.help_hint_rect().width(), self.help_hint_rect().height()
+        pixmap = QPixmap(w, h)
+        pixmap.fill(Qt.transparent)
+        painter = QPainter(pixmap)
+        painter.setRenderHint(QPainter.Antialiasing)
+        painter.setFont(self.hint_font)
         
         painter.setBrush(QBrush(QColor(0, 0, 0, 150)))
         painter.setPen(Qt.NoPen)
-        painter.drawRoundedRect(x, y, w, h, 5, 5)
+        painter.drawRoundedRect(0, 0, w, h, 5, 5)
         painter.setPen(QColor(200, 200, 200))
-        painter.drawText(QRect(x, y, w, h), Qt.AlignCenter, text)
+        painter.drawText(QRect(0, 0, w, h), Qt.AlignCenter, text)
+        painter.end()
+        return pixmap
+
+    def layout_notifications(self):
+        """Recomputes the notification boxes, call whenever the list or corner changes."""
+        font = self.notification_font
+        h = font_metrics(font).height() + 10
+        screen_geo = self.rect()
+        start_y = 100 if self.corner_pos not in [0, 3] else 150
+
+        self._notification_rects = []
+        self._notification_rect = QRect()
+        for i, (text, _) in enumerate(self.notifications):
+            w = measure_text(font, text) + 20
+            rect = QRect((screen_geo.width() - w) // 2, start_y + (i * (h + 5)), w, h)
+            self._notification_rects.append(rect)
+            self._notification_rect = self._notification_rect.united(rect.adjusted(-1, -1, 1, 1))
 
     def draw_notifications(self, painter):
-        now = datetime.now().timestamp()
-        self.notifications = [n for n in self.notifications if n[1] > now]
         if not self.notifications: return
 
-        painter.setFont(QFont("Sans", 12))
-        fm = painter.fontMetrics()
-        screen_geo = self.rect()
-        start_y = 100 if self.corner_pos not in [0, 3] else 150
-            
-        for i, (text, _) in enumerate(self.notifications):
-            w, h = fm.width(text) + 20, fm.height() + 10
-            x, y = (screen_geo.width() - w) // 2, start_y + (i * (h + 5))
-            
+        painter.setFont(self.notification_font)
+        for (text, _), rect in zip(self.notifications, self._notification_rects):
             painter.setBrush(QBrush(QColor(50, 50, 150, 200)))
             painter.setPen(QPen(QColor(255, 255, 255), 1))
-            painter.drawRoundedRect(x, y, w, h, 5, 5)
+            painter.drawRoundedRect(rect, 5, 5)
             painter.setPen(QColor(255, 255, 255))
-            painter.drawText(QRect(x, y, w, h), Qt.AlignCenter, text)
+            painter.drawText(rect, Qt.AlignCenter, text)
+
+    def text_bg_rect(self, font, text, x, y):
+        w = measure_text(font, text) + 10
+        h = font_metrics(font).height() + 4
+        return QRect(int(x - w/2), int(y - h/2 - 5), int(w), int(h))
 
     def draw_text_with_bg(self, painter, text, x, y, color, bg_alpha=180):
-        fm = painter.fontMetrics()
-        w = fm.width(text) + 10
-        h = fm.height() + 4
-        painter.setBrush(QBrush(QColor(0, 0, 0, bg_alpha)))
-        painter.setPen(Qt.NoPen)
-        painter.drawRect(int(x - w/2), int(y - h/2 - 5), int(w), int(h))
-        painter.setPen(color)
-        painter.drawText(int(x - w/2 + 5), int(y + 5), text)
+        """Draws text on a dark box centered at (x, y) and returns the area drawn."""
+        font = painter.font()
+        rect = self.text_bg_rect(font, text, x, y)
+
+        # Labels rarely change, so each one is rasterized once and blitted from the cache after that
+        key = f"text_bg|{font.key()}|{text}|{color.rgba()}|{bg_alpha}"
+        pixmap = QPixmapCache.find(key)
+        if pixmap is None:
+            # The baseline sits near the bottom of the box, descenders can hang below it
+            baseline = (rect.height() + 1) // 2 + 10
+            pixmap = QPixmap(rect.width(), max(rect.height(), baseline + font_metrics(font).descent()))
+            pixmap.fill(Qt.transparent)
+            pm_painter = QPainter(pixmap)
+            pm_painter.setRenderHint(QPainter.Antialiasing)
+            pm_painter.setFont(font)
+            pm_painter.fillRect(0, 0, rect.width(), rect.height(), QColor(0, 0, 0, bg_alpha))
+            pm_painter.setPen(color)
+            pm_painter.drawText(5, baseline, text)
+            pm_painter.end()
+            QPixmapCache.insert(key, pixmap)
+
+        painter.drawPixmap(rect.topLeft(), pixmap)
+        return QRect(rect.topLeft(), pixmap.size())
 
     def add_notification(self, text):
-        self.notifications.append((text, datetime.now().timestamp() + 2))
+        old_rect = self._notification_rect
+        self.notifications.append((text, time.monotonic() + 2))
+        self.layout_notifications()
+        self.update(old_rect.united(self._notification_rect))
+        if not self.notification_timer.isActive():
+            self.notification_timer.start(500)
+
+    def expire_notifications(self):
+        now = time.monotonic()
+        old_rect = self._notification_rect
+        expired = False
+        while self.notifications and self.notifications[0][1] <= now:
+            self.notifications.popleft()
+            expired = True
+        if expired:
+            self.layout_notifications()
+            self.update(old_rect.united(self._notification_rect))
+        if not self.notifications:
+            self.notification_timer.stop()
 
     def prompt_for_name(self, default_text=""):
         """Pauses normal overlay interaction to ask for a name."""
@@ -528,15 +818,35 @@ class OverlayWindow(QWidget):
         self.setFocus()
         return name, ok
 
+    def resizeEvent(self, event):
+        # Notifications are centered on the screen width
+        self.layout_notifications()
+        super().resizeEvent(event)
+
     # --- Input Handling ---
 
     def mouseMoveEvent(self, event):
-        self.cursor_pos = event.pos()
+        self.move_cursor(event.pos())
+
+    def move_cursor(self, pos):
+        if pos == self.cursor_pos:
+            return
+        # Only the label text and the ruler follow the cursor, so only repaint those
+        dirty = self._label_rect
+        self.cursor_pos = pos
+        self._label_rect = self.coordinate_label_rect()
+        dirty = dirty.united(self._label_rect)
+
+        self.update(dirty)
+
+        if self.capture_mode == "ruler" and self.ruler_start:
+            self.update_ruler()
 
     def mousePressEvent(self, event):
         if self.capture_mode == "edit":
             if event.button() == Qt.LeftButton:
                 self.select_nearest_item(event.pos())
+                self.update()
             return
 
         if event.button() == Qt.LeftButton:
@@ -563,30 +873,27 @@ class OverlayWindow(QWidget):
             if self.capture_mode == "normal":
                 self.capture_mode = "ruler"
                 self.ruler_start = event.pos()
+                self._ruler_end = None
+                self._ruler_rect = QRect()
+                self.update_ruler()
                 self.add_notification("Ruler Mode: Click to end")
             elif self.capture_mode == "ruler":
                 self.finish_ruler(event.pos())
 
     def finish_ruler(self, end_pos):
         if not self.ruler_start: return
+        # Also brings the label and the cached ruler end up to date if the click wasn't where the last move was
+        self.move_cursor(end_pos)
         start = self.ruler_start
-        end = end_pos
-        
-        if not self.shift_pressed:
-            dx = abs(end.x() - start.x())
-            dy = abs(end.y() - start.y())
-            if dx > dy * 10: end = QPoint(end.x(), start.y())
-            elif dy > dx * 10: end = QPoint(start.x(), end.y())
-
-        dist = math.sqrt((end.x() - start.x())**2 + (end.y() - start.y())**2)
+        end = self._ruler_end
+        dist = self._ruler_dist
         
         # Generate default name based on existing count
         default_name = self.main_window.get_next_sequence_name("measurement")
         # Ask user
         user_name, ok = self.prompt_for_name(default_name)
         if not ok:
-            self.capture_mode = "normal"
-            self.ruler_start = None
+            self.clear_ruler()
             return
 
         final_name = user_name if user_name else default_name
@@ -598,37 +905,46 @@ class OverlayWindow(QWidget):
         self.session_items.append((item, None))
         
         self.add_notification(f"Measurement: {final_name}")
+        self.clear_ruler()
+
+    def clear_ruler(self):
+        # Repaint only after the state is reset, the name dialog runs its own event loop
+        # and a repaint handled while still in ruler mode would just draw the ruler again
         self.capture_mode = "normal"
         self.ruler_start = None
+        self.update(self._ruler_rect)
 
     def select_nearest_item(self, pos):
         limit = 20 # pixels detection radius
         closest_idx = -1
-        min_dist = limit
+        # Compare squared distances, no need for a sqrt per item
+        min_d2 = limit * limit
+        px, py = pos.x(), pos.y()
         
         for i, (item, _) in enumerate(self.session_items):
-            d = 1000
             if isinstance(item, CoordinateItem):
-                d = math.sqrt((pos.x() - item.x)**2 + (pos.y() - item.y)**2)
+                dx, dy = px - item.x, py - item.y
+                d2 = dx * dx + dy * dy
             elif isinstance(item, MeasurementItem):
                 # Calculate distance to line segment
-                px, py = pos.x(), pos.y()
                 x1, y1, x2, y2 = item.x1, item.y1, item.x2, item.y2
                 
                 # Line segment length squared
-                l2 = (x1 - x2)**2 + (y1 - y2)**2
+                sx, sy = x2 - x1, y2 - y1
+                l2 = sx * sx + sy * sy
                 if l2 == 0:
-                    d = math.sqrt((px - x1)**2 + (py - y1)**2)
+                    dx, dy = px - x1, py - y1
                 else:
                     # Projection
-                    t = ((px - x1) * (x2 - x1) + (py - y1) * (y2 - y1)) / l2
+                    t = ((px - x1) * sx + (py - y1) * sy) / l2
                     t = max(0, min(1, t))
-                    proj_x = x1 + t * (x2 - x1)
-                    proj_y = y1 + t * (y2 - y1)
-                    d = math.sqrt((px - proj_x)**2 + (py - proj_y)**2)
+                    dx, dy = px - (x1 + t * sx), py - (y1 + t * sy)
+                d2 = dx * dx + dy * dy
+            else:
+                continue
             
-            if d < min_dist:
-                min_dist = d
+            if d2 < min_d2:
+                min_d2 = d2
                 closest_idx = i
         
         self.selected_item_index = closest_idx
@@ -638,6 +954,9 @@ class OverlayWindow(QWidget):
         
         if key == Qt.Key_Shift:
             self.shift_pressed = True
+            if self.capture_mode == "ruler" and self.ruler_start:
+                self.update_ruler()
+            return
         
         elif key == Qt.Key_E:
             if self.capture_mode == "edit":
@@ -663,10 +982,12 @@ class OverlayWindow(QWidget):
                 
         elif key == Qt.Key_Space:
             self.corner_pos = (self.corner_pos + 1) % 4
-            self.update()
+            self.layout_notifications()
         elif key == Qt.Key_H:
             self.show_help = not self.show_help
-            self.update()
+        elif not (self.capture_mode == "edit" and key in [Qt.Key_Delete, Qt.Key_R]):
+            # Any other key changes nothing on screen
+            return
             
         # Edit Mode Actions
         if self.capture_mode == "edit" and self.selected_item_index != -1:
@@ -675,6 +996,9 @@ class OverlayWindow(QWidget):
             elif key == Qt.Key_R:
                 self.rename_current_selection()
 
+        # Keys switch modes and corners, which can move anything on screen
+        self.update()
+
     def delete_current_selection(self):
         item, _ = self.session_items[self.selected_item_index]
         if self.main_window.remove_item_by_reference(item):
@@ -694,6 +1018,9 @@ class OverlayWindow(QWidget):
     def keyReleaseEvent(self, event):
         if event.key() == Qt.Key_Shift:
             self.shift_pressed = False
+            # Snapping comes back on
+            if self.capture_mode == "ruler" and self.ruler_start:
+                self.update_ruler()
 
 
 # --- Main Application Window ---
@@ -704,6 +1031,14 @@ class MainWindow(QMainWindow):
         self.setWindowTitle("Screen Coordinate Tool")
         self.resize(750, 650)
         self.data_store = DataStore()
+        # Also catch quitting while only the overlay is open
+        QApplication.instance().aboutToQuit.connect(self.data_store.close)
+        # Model item -> its tree item, so edit mode finds items without walking the whole tree
+        self._item_index: Dict[object, QTreeWidgetItem] = {}
+        self.overlay = None
+        # Folders are bold to distinguish them in the hierarchy, one shared font for all of them
+        self.folder_font = QFont()
+        self.folder_font.setBold(True)
         
         # Theme Setup
         self.dark_mode = False
@@ -741,6 +1076,11 @@ class MainWindow(QMainWindow):
         self.tree.itemChanged.connect(self.on_item_changed)
         self.tree.setContextMenuPolicy(Qt.CustomContextMenu)
         self.tree.customContextMenuRequested.connect(self.open_menu)
+
+        # The context menu is built once and just shown again on every right click
+        self.context_menu = QMenu(self)
+        self.action_del = self.context_menu.addAction("Delete")
+        self.action_grp = self.context_menu.addAction("Group into New Folder")
         
         # Key Shortcuts (Delete)
         self.shortcut_del = QApplication.instance().installEventFilter(self)
@@ -820,6 +1160,11 @@ class MainWindow(QMainWindow):
             # History Label Black
             self.history_label.setStyleSheet("font-size: 16px; margin-top: 10px; color: black;")
 
+    def closeEvent(self, event):
+        # Don't lose a save that is still waiting on the debounce timer or being written
+        self.data_store.close()
+        super().closeEvent(event)
+
     def eventFilter(self, source, event):
         if (event.type() == QEvent.KeyPress and event.key() == Qt.Key_Delete and 
             self.tree.hasFocus()):
@@ -829,8 +1174,11 @@ class MainWindow(QMainWindow):
 
     def start_capture(self):
         self.hide()
-        self.overlay = OverlayWindow(self)
-        self.overlay.show()
+        # The overlay window is built on first use and reused for every capture after that
+        if self.overlay is None:
+            self.overlay = OverlayWindow(self)
+        self.overlay.reset_state()
+        self.overlay.showFullScreen()
 
     def get_next_sequence_name(self, item_type: str) -> str:
         """Counts existing items in the tree to generate sequential names."""
@@ -838,7 +1186,7 @@ class MainWindow(QMainWindow):
         iterator = QTreeWidgetItemIterator(self.tree)
         while iterator.value():
             item = iterator.value()
-            data = item.data(0, Qt.UserRole)
+            data = item.model
             
             if item_type == "point" and isinstance(data, CoordinateItem):
                 count += 1
@@ -877,42 +1225,46 @@ class MainWindow(QMainWindow):
             self.save_data()
 
     def create_tree_item(self, model_item):
-        item = QTreeWidgetItem()
-        item.setData(0, Qt.UserRole, model_item)
+        item = ModelTreeItem(model_item)
+        self._item_index[model_item] = item
         
         item.setFlags(Qt.ItemIsEnabled | Qt.ItemIsSelectable | Qt.ItemIsEditable | 
                       Qt.ItemIsDragEnabled | Qt.ItemIsDropEnabled)
         
-        if isinstance(model_item, FolderItem):
-            item.setText(0, "📁 " + model_item.name)
-            item.setText(1, f"{len(model_item.items)} items")
-            item.setExpanded(model_item.expanded)
-            
-            # Make Folders Bold to distinguish them in the hierarchy
-            font = item.font(0)
-            font.setBold(True)
-            item.setFont(0, font)
-            
-            for child in model_item.items:
-                child_tree_item = self.create_tree_item(child)
-                item.addChild(child_tree_item)
-                
-        elif isinstance(model_item, CoordinateItem):
-            item.setText(0, "📍 " + model_item.name)
-            item.setText(1, f"({model_item.x}, {model_item.y})")
-            
-        elif isinstance(model_item, MeasurementItem):
-            item.setText(0, "📏 " + model_item.name)
-            detail = f"{int(model_item.distance)}px ({model_item.x1},{model_item.y1})→({model_item.x2},{model_item.y2})"
-            if model_item.auto_aligned: detail += " [Aligned]"
-            item.setText(1, detail)
+        item.setText(0, model_item.col0)
+        item.setText(1, model_item.col1)
+
+        build = self._TREE_BUILDERS.get(type(model_item))
+        if build is not None:
+            build(self, item, model_item)
 
         return item
 
+    def _build_folder_item(self, item, model_item):
+        item.setFont(0, self.folder_font)
+        for child in model_item.items:
+            item.addChild(self.create_tree_item(child))
+
+    # Extra per-type setup for tree items, looked up by exact type instead of an isinstance chain.
+    # Points and measurements need nothing beyond their cached display text.
+    _TREE_BUILDERS = {FolderItem: _build_folder_item}
+
     def refresh_tree(self):
-        self.tree.clear()
-        for item in self.data_store.root_items:
-            self.tree.addTopLevelItem(self.create_tree_item(item))
+        with self.tree.bulk_update():
+            self.tree.clear()
+            self._item_index.clear()
+            for item in self.data_store.root_items:
+                self.tree.addTopLevelItem(self.create_tree_item(item))
+
+            # Items can only be expanded once they are in the tree. Expanding everything in
+            # one go and collapsing the few saved as collapsed is much cheaper than per folder.
+            self.tree.expandAll()
+            iterator = QTreeWidgetItemIterator(self.tree, QTreeWidgetItemIterator.HasChildren)
+            while iterator.value():
+                item = iterator.value()
+                if not item.model.expanded:
+                    item.setExpanded(False)
+                iterator += 1
 
     def save_data(self):
         self.data_store.save_from_tree(self.tree)
@@ -922,76 +1274,77 @@ class MainWindow(QMainWindow):
             self.tree.editItem(item, 0)
     
     def on_item_changed(self, item, column):
-        # Triggered when renaming is done
+        # Triggered when renaming is done. Column 1 only ever gets derived text like folder counts.
+        if column != 0:
+            return
         self.save_data()
 
-    def recalculate_folder_counts(self):
-        """Recursively update folder item counts"""
-        def process_item(item):
-            data = item.data(0, Qt.UserRole)
-            if isinstance(data, FolderItem):
-                count = item.childCount()
-                item.setText(1, f"{count} items")
-                for i in range(count):
-                    process_item(item.child(i))
-                    
-        root = self.tree.invisibleRootItem()
-        for i in range(root.childCount()):
-            process_item(root.child(i))
+    def update_folder_counts(self, tree_items):
+        """Updates the item count of the given folders, anything else (or None) is skipped"""
+        # Tree items aren't hashable, so de-duplicate by id
+        with QSignalBlocker(self.tree):
+            for item in {id(item): item for item in tree_items if item is not None}.values():
+                # The invisible root is a plain QTreeWidgetItem without a model
+                data = getattr(item, "model", None)
+                if isinstance(data, FolderItem):
+                    data.col1 = f"{item.childCount()} items"
+                    item.setText(1, data.col1)
 
     def open_menu(self, position):
         indexes = self.tree.selectedIndexes()
         if not indexes: return
 
-        menu = QMenu()
-        action_del = menu.addAction("Delete")
-        action_grp = menu.addAction("Group into New Folder")
-        
-        action = menu.exec_(self.tree.viewport().mapToGlobal(position))
+        action = self.context_menu.exec_(self.tree.viewport().mapToGlobal(position))
         
-        if action == action_del:
+        if action is self.action_del:
             self.delete_selected()
-        elif action == action_grp:
+        elif action is self.action_grp:
             self.group_selected()
 
     def delete_selected(self):
         root = self.tree.invisibleRootItem()
-        for item in self.tree.selectedItems():
-            (item.parent() or root).removeChild(item)
-        
-        self.recalculate_folder_counts()
+        with self.tree.bulk_update():
+            parents = []
+            for item in self.tree.selectedItems():
+                self._forget_tree_items(item)
+                parents.append(item.parent())
+                (item.parent() or root).removeChild(item)
+            
+            self.update_folder_counts(parents)
         self.save_data()
 
     def remove_item_by_reference(self, model_item):
         """Helper for Overlay Edit Mode to delete items"""
-        iterator = QTreeWidgetItemIterator(self.tree)
-        while iterator.value():
-            item = iterator.value()
-            if item.data(0, Qt.UserRole) == model_item:
-                (item.parent() or self.tree.invisibleRootItem()).removeChild(item)
-                self.recalculate_folder_counts()
-                self.save_data()
-                return True
-            iterator += 1
-        return False
+        item = self._item_index.get(model_item)
+        if item is None:
+            return False
+        self._forget_tree_items(item)
+        parent = item.parent()
+        (parent or self.tree.invisibleRootItem()).removeChild(item)
+        self.update_folder_counts([parent])
+        self.save_data()
+        return True
 
     def rename_item_by_reference(self, model_item, new_name):
         """Helper for Overlay Edit Mode to rename items"""
-        iterator = QTreeWidgetItemIterator(self.tree)
-        while iterator.value():
-            item = iterator.value()
-            if item.data(0, Qt.UserRole) == model_item:
-                # Update Model
-                model_item.name = new_name
-                # Update UI (Respecting prefixes)
-                prefix = ""
-                if isinstance(model_item, CoordinateItem): prefix = "📍 "
-                elif isinstance(model_item, MeasurementItem): prefix = "📏 "
-                item.setText(0, prefix + new_name)
-                self.save_data()
-                return True
-            iterator += 1
-        return False
+        item = self._item_index.get(model_item)
+        if item is None:
+            return False
+        # Update Model, then the UI from its cached display text (prefix included)
+        model_item.rename(new_name)
+        # Saved once below, itemChanged would only queue the same save again
+        with QSignalBlocker(self.tree):
+            item.setText(0, model_item.col0)
+        self.save_data()
+        return True
+
+    def _forget_tree_items(self, tree_item):
+        """Drops a tree item that is being removed, and everything under it, from the lookup index."""
+        stack = [tree_item]
+        while stack:
+            item = stack.pop()
+            self._item_index.pop(item.model, None)
+            stack.extend(item.child(i) for i in range(item.childCount()))
 
     def group_selected(self):
         items = self.tree.selectedItems()
@@ -1007,14 +1360,17 @@ class MainWindow(QMainWindow):
         parent = first_item.parent() or self.tree.invisibleRootItem()
         index = parent.indexOfChild(first_item)
         
-        parent.insertChild(index, folder_tree_item)
-        
-        for item in items:
-            (item.parent() or self.tree.invisibleRootItem()).removeChild(item)
-            folder_tree_item.addChild(item)
+        with self.tree.bulk_update():
+            parent.insertChild(index, folder_tree_item)
             
-        folder_tree_item.setExpanded(True)
-        self.recalculate_folder_counts()
+            old_parents = []
+            for item in items:
+                old_parents.append(item.parent())
+                (item.parent() or self.tree.invisibleRootItem()).removeChild(item)
+                folder_tree_item.addChild(item)
+                
+            folder_tree_item.setExpanded(True)
+            self.update_folder_counts(old_parents + [parent, folder_tree_item])
         self.save_data()
 
     def clear_all(self):
@@ -1022,25 +1378,29 @@ class MainWindow(QMainWindow):
                                   QMessageBox.Yes | QMessageBox.No)
         if ret == QMessageBox.Yes:
             self.tree.clear()
+            self._item_index.clear()
             self.save_data()
 
     def export_data(self):
         path, _ = QFileDialog.getSaveFileName(self, "Export", "coordinates.txt", "Text Files (*.txt)")
         if path:
             try:
-                with open(path, 'w') as f:
-                    f.write("Screen Coordinate Tool Export\n")
-                    f.write("===========================\n\n")
-                    self._export_recursive(f, self.tree.invisibleRootItem())
+                # Lines are collected first and written in one go through a large buffer
+                parts = ["Screen Coordinate Tool Export\n", "===========================\n\n"]
+                self._export_tree(parts, self.tree.invisibleRootItem())
+                with open(path, 'w', buffering=1 << 20) as f:
+                    f.write("".join(parts))
                 QMessageBox.information(self, "Success", f"Saved to {path}")
             except Exception as e:
                 QMessageBox.critical(self, "Error", str(e))
 
-    def _export_recursive(self, f, parent_item, indent=""):
-        for i in range(parent_item.childCount()):
-            item = parent_item.child(i)
-            f.write(f"{indent}{item.text(0)} - {item.text(1)}\n")
-            self._export_recursive(f, item, indent + "  ")
+    def _export_tree(self, parts, parent_item):
+        # Depth first with an explicit stack, children are pushed reversed so they come out in order
+        stack = [(parent_item.child(i), 0) for i in reversed(range(parent_item.childCount()))]
+        while stack:
+            item, depth = stack.pop()
+            parts.append(f"{'  ' * depth}{item.text(0)} - {item.text(1)}\n")
+            stack.extend((item.child(i), depth + 1) for i in reversed(range(item.childCount())))
 
 if __name__ == '__main__':
     app = QApplication(sys.argv)